@@ -152,6 +152,10 @@ def main(
     ctx.obj["config_manager"] = config_manager
     ctx.obj["output_formatter"] = output_formatter
 
+    # The formatter is shared across in-process invocations; resolve the
+    # output format afresh for this one
+    output_formatter.invalidate_format_cache()
+
     # Get profile from callback or use default
     profile_obj = ctx.meta.get("profile") if ctx.meta else None
     if profile_obj is None:
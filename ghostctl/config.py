@@ -7,6 +7,7 @@ updating, deleting, and switching between different Ghost CMS instances.
 import os
 import tomllib
 import json
+import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 from urllib.parse import urlparse
@@ -17,6 +18,11 @@ import requests
 
 from .exceptions import ConfigError
 
+logger = logging.getLogger(__name__)
+
+_ADMIN_KEY_ID_RE = re.compile(r"^[a-f0-9]{24}$")
+_CONTENT_KEY_RE = re.compile(r"^[a-f0-9]{24,26}$")
+
 
 class Profile(BaseModel):
     """Configuration profile for a Ghost CMS instance."""
@@ -50,7 +56,7 @@ class Profile(BaseModel):
             raise ValueError("Admin key ID and secret cannot be empty")
 
         # Validate key ID format (should be hex string)
-        if not re.match(r"^[a-f0-9]{24}$", key_id):
+        if not _ADMIN_KEY_ID_RE.match(key_id):
             raise ValueError("Invalid admin key ID format")
 
         return v
@@ -63,7 +69,7 @@ class Profile(BaseModel):
             return v
 
         # Content keys should be hex strings (typically 24-26 characters)
-        if not re.match(r"^[a-f0-9]{24,26}$", v):
+        if not _CONTENT_KEY_RE.match(v):
             raise ValueError("Invalid content key format")
 
         return v
@@ -127,6 +133,12 @@ class ConfigManager:
         self._active_profile: Optional[str] = None
         self._load_config()
 
+    def reload(self) -> None:
+        """Re-read the configuration file and profile files from disk."""
+        self._profiles.clear()
+        self._active_profile = None
+        self._load_config()
+
     def create_profile(
         self,
         name: str,
@@ -361,8 +373,7 @@ class ConfigManager:
             ConfigError: If import fails
         """
         try:
-            with open(file_path, "r") as f:
-                profile_data = json.load(f)
+            profile_data = json.loads(Path(file_path).read_text())
 
             name = profile_data.get("name")
             if not name:
@@ -469,7 +480,7 @@ class ConfigManager:
                     self._profiles[profile.name] = profile
                 except Exception as e:
                     # Log warning but continue loading other profiles
-                    print(f"Warning: Failed to load profile {profile_file}: {e}")
+                    logger.warning("Failed to load profile %s: %s", profile_file, e)
 
         except Exception as e:
             raise ConfigError(f"Failed to load configuration: {e}")
@@ -482,11 +493,13 @@ class ConfigManager:
                 "version": "1.0",
             }
 
-            # Create TOML content manually since tomllib is read-only
+            # Create TOML content manually since tomllib is read-only.
+            # TOML has no null, so an unset active profile is omitted.
             toml_content = f"""# Ghost CMS CLI Configuration
 version = "{config_data['version']}"
-active_profile = {f'"{config_data["active_profile"]}"' if config_data["active_profile"] else "null"}
 """
+            if config_data["active_profile"]:
+                toml_content += f'active_profile = "{config_data["active_profile"]}"\n'
 
             with open(self.config_file, "w") as f:
                 f.write(toml_content)
@@ -4,11 +4,17 @@ This module provides various output formatters for displaying data
 in different formats including tables, JSON, and YAML.
 """
 
+import re
 import sys
 import json
-import yaml
+import functools
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, Callable, TextIO
+from collections import defaultdict
+from collections.abc import Sized
+from itertools import islice
+from operator import is_not, itemgetter
+from typing import Any, DefaultDict, Dict, Iterable, List, Optional, Union, Callable, TextIO
 from io import StringIO
 import os
 
@@ -20,6 +26,47 @@ from rich import box
 
 from .exceptions import ValidationError
 
+# Table cell text for False/True, indexed by the bool itself
+_BOOL_CELLS = ("✗", "✓")
+
+# CSI sequences and single-character escapes
+_ANSI_RE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
+# Last metadata timestamp as [monotonic time taken, ISO string]; reused for
+# up to _TS_TTL seconds
+_TS_CACHE = [float("-inf"), ""]
+_TS_TTL = 1.0
+
+# C-level "item is not None" predicate for filter()
+_is_not_none = functools.partial(is_not, None)
+
+
+def _json_dumps(data: Any, indent: Optional[int] = None) -> str:
+    """Serialize data to JSON text.
+
+    Args:
+        data: Data to serialize
+        indent: Indentation width, or None for compact output
+
+    Returns:
+        JSON text
+    """
+    return json.dumps(data, indent=indent, ensure_ascii=False, default=str)
+
+
+@functools.lru_cache(maxsize=256)
+def _split_path(path: str) -> tuple[str, ...]:
+    """Split a dotted field path into its keys, cached per distinct path."""
+    return tuple(path.split("."))
+
+
+def _get_or_empty(*fields: str) -> Callable[[Dict[str, Any]], Any]:
+    """Like ``operator.itemgetter`` but missing keys read as empty strings."""
+    if len(fields) == 1:
+        field = fields[0]
+        return lambda item: item.get(field, "")
+    return lambda item: tuple(item.get(field, "") for field in fields)
+
 
 class OutputFormatter:
     """Main output formatter that handles multiple output formats."""
@@ -32,10 +79,17 @@ class OutputFormatter:
         """
         self.console = console or Console()
         self._custom_formatters: Dict[str, Callable] = {}
+        self._format_cache: Optional[str] = None
 
     def determine_format(self, format_override: Optional[str] = None) -> str:
         """Determine the output format to use.
 
+        The format is resolved once per invocation (CLI flag, then environment
+        variable, then terminal detection) and cached, so it stays fixed for
+        the duration of a single command execution. The CLI entry point calls
+        ``invalidate_format_cache`` at the start of every invocation; use
+        ``set_format`` or ``invalidate_format_cache`` to change it otherwise.
+
         Args:
             format_override: Explicit format override
 
@@ -46,6 +100,24 @@ class OutputFormatter:
         if format_override:
             return format_override.lower()
 
+        if self._format_cache is None:
+            self._format_cache = self._resolve_format()
+        return self._format_cache
+
+    def set_format(self, format_name: str) -> None:
+        """Set the output format explicitly, replacing any cached value.
+
+        Args:
+            format_name: Format name (table, json, yaml or a custom format)
+        """
+        self._format_cache = format_name.lower()
+
+    def invalidate_format_cache(self) -> None:
+        """Forget the cached output format so it is resolved again."""
+        self._format_cache = None
+
+    def _resolve_format(self) -> str:
+        """Resolve the output format from CLI arguments, environment and terminal."""
         # Check command line arguments
         if "--format" in sys.argv:
             try:
@@ -204,6 +276,7 @@ class OutputFormatter:
         streaming: bool = False,
         skip_invalid: bool = False,
         field_config: Optional[Dict[str, Any]] = None,
+        stream: Optional[TextIO] = None,
         **kwargs: Any,
     ) -> None:
         """Render data as JSON.
@@ -216,10 +289,13 @@ class OutputFormatter:
             streaming: Whether to use streaming output for large datasets
             skip_invalid: Whether to skip invalid entries
             field_config: Field configuration for filtering/aliasing
+            stream: Text stream to write to (defaults to sys.stdout)
             **kwargs: Additional arguments
         """
+        out = sys.stdout if stream is None else stream
+
         if not data:
-            print("[]")
+            print("[]", file=out)
             return
 
         # Apply field filtering
@@ -228,38 +304,52 @@ class OutputFormatter:
 
         # Handle invalid data
         if skip_invalid and isinstance(data, list):
-            data = [item for item in data if item is not None]
+            data = list(filter(_is_not_none, data))
 
         try:
             if streaming and isinstance(data, list) and len(data) > 100:
-                # Stream large datasets
-                print("[")
-                for i, item in enumerate(data):
-                    if i > 0:
-                        print(",")
-                    print(json.dumps(item, indent=indent if pretty else None, default=str), end="")
-                print("\n]")
+                self._stream_json(data, indent=indent if pretty else None, stream=out)
             else:
                 # Standard JSON output
-                output = json.dumps(
-                    data,
-                    indent=indent if pretty else None,
-                    ensure_ascii=False,
-                    default=str,
-                )
-                print(output)
+                output = _json_dumps(data, indent=indent if pretty else None)
+                print(output, file=out)
 
         except (TypeError, ValueError) as e:
             if "circular reference" in str(e).lower():
                 raise ValidationError("Circular reference detected in data structure")
             raise ValidationError(f"Failed to serialize data to JSON: {e}")
 
+    def _stream_json(
+        self,
+        data: List[Any],
+        indent: Optional[int] = None,
+        stream: Optional[TextIO] = None,
+    ) -> None:
+        """Write a JSON array one element at a time.
+
+        Each item is serialized and written on its own, so peak memory is
+        bounded by the largest item rather than the whole document.
+
+        Args:
+            data: Items to write
+            indent: Indentation width for each item, or None for compact output
+            stream: Text stream to write to (defaults to sys.stdout)
+        """
+        write = (sys.stdout if stream is None else stream).write
+        separator = "[\n"
+        for item in data:
+            write(separator)
+            write(_json_dumps(item, indent=indent))
+            separator = ",\n"
+        write("\n]")
+
     def render_yaml(
         self,
         data: Any,
         include_metadata: bool = False,
         document_separator: bool = False,
         field_config: Optional[Dict[str, Any]] = None,
+        stream: Optional[TextIO] = None,
         **kwargs: Any,
     ) -> None:
         """Render data as YAML.
@@ -269,33 +359,56 @@ class OutputFormatter:
             include_metadata: Whether to include metadata comments
             document_separator: Whether to use document separators
             field_config: Field configuration for filtering/aliasing
+            stream: Text stream to write to (defaults to sys.stdout)
             **kwargs: Additional arguments
         """
+        out = sys.stdout if stream is None else stream
+
         if not data:
-            print("[]")
+            print("[]", file=out)
             return
 
+        # PyYAML is only needed for YAML output, so import it on first use
+        import yaml
+
+        # libyaml-backed dumper when PyYAML was built with it. Use the full
+        # dumper, like yaml.dump, so Decimal, enums and similar still render
+        dumper = getattr(yaml, "CDumper", yaml.Dumper)
+
         # Apply field configuration
         if field_config:
             data = self._apply_field_config(data, field_config)
 
+        # Build the whole document in memory and write it once
+        buffer = StringIO()
         try:
             if include_metadata:
-                print("# Generated by Ghost CMS CLI")
-                print(f"# Timestamp: {self._get_timestamp()}")
-                print("---")
+                buffer.write("# Generated by Ghost CMS CLI\n")
+                buffer.write(f"# Timestamp: {self._get_timestamp()}\n")
+                buffer.write("---\n")
 
             if document_separator and isinstance(data, list):
-                for i, item in enumerate(data):
-                    if i > 0:
-                        print("---")
-                    print(yaml.dump(item, default_flow_style=False, allow_unicode=True))
+                yaml.dump_all(
+                    data,
+                    buffer,
+                    Dumper=dumper,
+                    default_flow_style=False,
+                    allow_unicode=True,
+                )
             else:
-                print(yaml.dump(data, default_flow_style=False, allow_unicode=True))
+                yaml.dump(
+                    data,
+                    buffer,
+                    Dumper=dumper,
+                    default_flow_style=False,
+                    allow_unicode=True,
+                )
 
         except yaml.YAMLError as e:
             raise ValidationError(f"Failed to serialize data to YAML: {e}")
 
+        out.write(buffer.getvalue())
+
     def render_to_file(
         self,
         data: Any,
@@ -387,57 +500,100 @@ class OutputFormatter:
         for col in columns:
             table.add_column(col.replace("_", " ").title(), overflow="fold")
 
-        # Add rows
+        # Add rows; cells are plain Text so Rich never parses data as markup
+        row_template = self._build_row_template(columns)
         for item in data:
-            row = []
-            for col in columns:
-                value = item.get(col, "")
-                if value is None:
-                    value = ""
-                elif isinstance(value, (list, dict)):
-                    value = str(value)
-                elif isinstance(value, bool):
-                    value = "✓" if value else "✗"
-                row.append(str(value))
-            table.add_row(*row)
+            table.add_row(*map(Text, row_template(item)))
 
         # Render table
         if colors:
             self.console.print(table)
         else:
-            with self.console.capture() as capture:
-                self.console.print(table)
-            # Strip ANSI codes for non-color output
-            plain_output = self._strip_ansi(capture.get())
+            # Render into a private, colourless console instead of capturing
+            # the shared one
+            buffer = StringIO()
+            plain_console = Console(
+                file=buffer,
+                width=self.console.width,
+                color_system=None,
+                markup=False,
+                highlight=False,
+            )
+            plain_console.print(table)
+            # Strip any remaining ANSI codes for non-color output
+            plain_output = self._strip_ansi(buffer.getvalue())
             print(plain_output)
 
+    def _build_row_template(self, columns: List[str]) -> Callable[[Dict[str, Any]], List[str]]:
+        """Build a row formatter for a fixed column list.
+
+        The column tuple is bound once per table so the per-row work is a
+        single comprehension; cell padding is left to Rich, which computes
+        the column widths.
+        """
+        cols = tuple(columns)
+        format_cell = self._format_cell
+
+        def row_template(item: Dict[str, Any]) -> List[str]:
+            return [format_cell(item.get(col, "")) for col in cols]
+
+        return row_template
+
+    @staticmethod
+    def _format_cell(value: Any) -> str:
+        """Convert a single value to its table cell text."""
+        if value.__class__ is str:
+            return value
+        if value is None:
+            return ""
+        if value.__class__ is bool:
+            return _BOOL_CELLS[value]
+        return str(value)
+
     def _render_paginated_table(
         self,
-        data: List[Dict[str, Any]],
+        data: Iterable[Dict[str, Any]],
         page_size: int,
         interactive: bool,
         **table_kwargs: Any,
     ) -> None:
-        """Render paginated table."""
-        total_pages = (len(data) + page_size - 1) // page_size
-        current_page = 1
+        """Render paginated table.
+
+        Pages are pulled from ``data`` with ``islice``, so any iterable
+        works and only one page is held at a time. Sized inputs show the
+        total page count; for one-shot iterators, columns are resolved from
+        the first page.
+        """
+        sized = isinstance(data, Sized)
+        total_pages = (len(data) + page_size - 1) // page_size if sized else None
+        rows = iter(data)
+        page_data = list(islice(rows, page_size))
 
-        while current_page <= total_pages:
-            start_idx = (current_page - 1) * page_size
-            end_idx = start_idx + page_size
-            page_data = data[start_idx:end_idx]
+        # Resolve columns once so every page shares the same row template
+        if not table_kwargs.get("columns"):
+            all_keys = set()
+            for item in data if sized else page_data:
+                all_keys.update(item.keys())
+            table_kwargs["columns"] = sorted(all_keys)
 
+        original_title = table_kwargs.get("title") or ""
+        current_page = 1
+        while page_data:
             # Update title to include page info
-            original_title = table_kwargs.get("title", "")
-            table_kwargs["title"] = f"{original_title} (Page {current_page} of {total_pages})"
+            page_label = f"Page {current_page}"
+            if total_pages is not None:
+                page_label += f" of {total_pages}"
+            table_kwargs["title"] = f"{original_title} ({page_label})" if original_title else page_label
 
             self._render_table_data(page_data, **table_kwargs)
 
-            if interactive and current_page < total_pages:
+            next_page = list(islice(rows, page_size))
+            if interactive and next_page:
                 user_input = input("\nPress Enter for next page, 'q' to quit: ").strip().lower()
                 if user_input == "q":
                     break
 
+            page_data = next_page
             current_page += 1
 
     def _apply_field_config(self, data: Any, config: Dict[str, Any]) -> Any:
@@ -445,39 +601,40 @@ class OutputFormatter:
         if not isinstance(data, list):
             data = [data]
 
+        # Resolve the configuration once rather than per row
+        include = config.get("include")
+        excluded = frozenset(config.get("exclude") or ())
+        include_fields = [
+            (field, "." in field)
+            for field in include or ()
+            if field not in excluded
+        ]
+        aliases = config.get("aliases") or {}
+        computed_fields = config.get("computed") or {}
+        get_nested = self._get_nested_value
+
         result = []
         for item in data:
             if not isinstance(item, dict):
                 continue
 
-            new_item = {}
-
             # Apply include/exclude filters
-            include_fields = config.get("include")
-            exclude_fields = config.get("exclude", [])
-
-            if include_fields:
-                for field in include_fields:
-                    if "." in field:  # Nested field access
-                        value = self._get_nested_value(item, field)
-                    else:
-                        value = item.get(field)
-                    new_item[field] = value
+            if include:
+                new_item = {
+                    field: get_nested(item, field) if nested else item.get(field)
+                    for field, nested in include_fields
+                }
+            elif excluded:
+                new_item = {key: value for key, value in item.items() if key not in excluded}
             else:
                 new_item = item.copy()
 
-            # Remove excluded fields
-            for field in exclude_fields:
-                new_item.pop(field, None)
-
             # Apply aliases
-            aliases = config.get("aliases", {})
             for old_name, new_name in aliases.items():
                 if old_name in new_item:
                     new_item[new_name] = new_item.pop(old_name)
 
             # Add computed fields
-            computed_fields = config.get("computed", {})
             for field_name, computation in computed_fields.items():
                 try:
                     new_item[field_name] = computation(item)
@@ -515,37 +672,54 @@ class OutputFormatter:
         return result
 
     def _sort_data(self, data: List[Dict[str, Any]], sort_by: List[tuple[str, str]]) -> List[Dict[str, Any]]:
-        """Sort data by specified fields."""
-        def sort_key(item: Dict[str, Any]) -> tuple:
-            key_values = []
-            for field, direction in sort_by:
-                value = item.get(field, "")
-                if direction.lower() == "desc":
-                    # For descending, negate numeric values or reverse strings
-                    if isinstance(value, (int, float)):
-                        value = -value
-                    elif isinstance(value, str):
-                        value = value[::-1]  # Reverse string for sorting
-                key_values.append(value)
-            return tuple(key_values)
-
-        return sorted(data, key=sort_key)
+        """Sort data by specified fields.
+
+        All-ascending sorts use a single pass over a composite key. Mixed
+        directions run one stable sort per field, least significant first,
+        so each field can be reversed independently. Keys are extracted with
+        ``operator.itemgetter`` when every row has the sort fields, falling
+        back to treating missing values as empty strings.
+        """
+        try:
+            return self._sort_rows(data, sort_by, itemgetter)
+        except KeyError:
+            return self._sort_rows(data, sort_by, _get_or_empty)
+
+    @staticmethod
+    def _sort_rows(
+        data: List[Dict[str, Any]],
+        sort_by: List[tuple[str, str]],
+        make_key: Callable[..., Callable[[Dict[str, Any]], Any]],
+    ) -> List[Dict[str, Any]]:
+        """Sort rows using key functions built by ``make_key(*fields)``."""
+        if all(direction.lower() != "desc" for _, direction in sort_by):
+            return sorted(data, key=make_key(*(field for field, _ in sort_by)))
+
+        result = list(data)
+        for field, direction in reversed(sort_by):
+            result.sort(key=make_key(field), reverse=direction.lower() == "desc")
+        return result
 
     def _group_data(self, data: List[Dict[str, Any]], group_by: str) -> Dict[str, List[Dict[str, Any]]]:
-        """Group data by a field."""
-        groups: Dict[str, List[Dict[str, Any]]] = {}
-        for item in data:
-            group_value = str(item.get(group_by, "Unknown"))
-            if group_value not in groups:
-                groups[group_value] = []
-            groups[group_value].append(item)
-        return groups
+        """Group data by a field, keeping groups in first-seen order.
+
+        Dotted field names (e.g. ``author.name``) are resolved with
+        ``_get_nested_value``; items without the field go to ``Unknown``.
+        """
+        groups: DefaultDict[str, List[Dict[str, Any]]] = defaultdict(list)
+        if "." in group_by:
+            for item in data:
+                value = self._get_nested_value(item, group_by)
+                groups["Unknown" if value is None else str(value)].append(item)
+        else:
+            for item in data:
+                groups[str(item.get(group_by, "Unknown"))].append(item)
+        return dict(groups)
 
     def _get_nested_value(self, obj: Dict[str, Any], path: str) -> Any:
         """Get nested value from object using dot notation."""
-        parts = path.split(".")
         current = obj
-        for part in parts:
+        for part in _split_path(path):
             if isinstance(current, dict) and part in current:
                 current = current[part]
             else:
@@ -553,15 +727,23 @@ class OutputFormatter:
         return current
 
     def _get_timestamp(self) -> str:
-        """Get current timestamp."""
+        """Get current timestamp.
+
+        The value is cached for ``_TS_TTL`` seconds so rendering many
+        documents in a row does not format a fresh timestamp for each one.
+        """
+        now = time.monotonic()
+        if now - _TS_CACHE[0] < _TS_TTL:
+            return _TS_CACHE[1]
+
         from datetime import datetime
-        return datetime.now().isoformat()
+        _TS_CACHE[0] = now
+        _TS_CACHE[1] = datetime.now().isoformat()
+        return _TS_CACHE[1]
 
     def _strip_ansi(self, text: str) -> str:
         """Strip ANSI escape sequences from text."""
-        import re
-        ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-        return ansi_escape.sub("", text)
+        return _ANSI_RE.sub("", text)
 
 
 # Convenience functions
@@ -8,7 +8,7 @@ and protecting against cascading failures.
 import time
 import random
 import threading
-from typing import Callable, TypeVar, Any, Dict, Optional, List, Type
+from typing import Callable, TypeVar, Any, Dict, Optional, List, Tuple, Type, Union
 from functools import wraps
 from enum import Enum
 
@@ -18,6 +18,8 @@ from ..exceptions import MaxRetriesExceededError, CircuitBreakerOpenError
 
 T = TypeVar("T")
 
+ExceptionTypes = Union[Type[Exception], Tuple[Type[Exception], ...]]
+
 
 class CircuitBreakerState(Enum):
     """Circuit breaker states."""
@@ -204,22 +206,33 @@ class CircuitBreaker:
         self,
         failure_threshold: int = 5,
         recovery_timeout: float = 30.0,
-        expected_exception: Type[Exception] = Exception,
+        expected_exception: ExceptionTypes = Exception,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         """Initialize circuit breaker.
 
         Args:
             failure_threshold: Number of failures before opening circuit
             recovery_timeout: Time to wait before attempting recovery
-            expected_exception: Exception type that triggers circuit breaker
+            expected_exception: Exception type, or tuple of types, that
+                triggers circuit breaker
+            clock: Function returning the current time in seconds, used to
+                time the recovery window
         """
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.expected_exception = expected_exception
+        self._expected_exceptions: Tuple[Type[Exception], ...] = (
+            expected_exception if isinstance(expected_exception, tuple) else (expected_exception,)
+        )
+        self._clock = clock
 
         self._state = CircuitBreakerState.CLOSED
         self._failure_count = 0
+        # Wall-clock (epoch) time of the last failure, for reporting
         self._last_failure_time: Optional[float] = None
+        # Reading of ``clock`` at the last failure, for timing recovery
+        self._last_failure_clock: Optional[float] = None
         self._lock = threading.Lock()
 
     @property
@@ -232,15 +245,26 @@ class CircuitBreaker:
         self._state = CircuitBreakerState.CLOSED
         self._failure_count = 0
         self._last_failure_time = None
+        self._last_failure_clock = None
+
+    def reset(self) -> None:
+        """Close the circuit and clear the failure count."""
+        with self._lock:
+            self._reset()
 
     def _record_failure(self) -> None:
         """Record a failure and update state if necessary."""
         self._failure_count += 1
-        self._last_failure_time = time.time()
+        self._mark_failure_time()
 
         if self._failure_count >= self.failure_threshold:
             self._state = CircuitBreakerState.OPEN
 
+    def _mark_failure_time(self) -> None:
+        """Record when the latest failure happened."""
+        self._last_failure_time = time.time()
+        self._last_failure_clock = self._clock()
+
     def _can_attempt_call(self) -> bool:
         """Check if a call can be attempted based on current state."""
         if self._state == CircuitBreakerState.CLOSED:
@@ -250,11 +274,11 @@ class CircuitBreaker:
             return True
 
         # State is OPEN
-        if self._last_failure_time is None:
+        if self._last_failure_clock is None:
             return True
 
         # Check if recovery timeout has passed
-        if time.time() - self._last_failure_time >= self.recovery_timeout:
+        if self._clock() - self._last_failure_clock >= self.recovery_timeout:
             self._state = CircuitBreakerState.HALF_OPEN
             return True
 
@@ -283,33 +307,31 @@ class CircuitBreaker:
 
         try:
             result = operation()
-
-            # Success - reset if we were in half-open state
+        except self._expected_exceptions:
+            # Only expected exceptions count towards the circuit breaker
             with self._lock:
                 if current_state == CircuitBreakerState.HALF_OPEN:
-                    self._reset()
-
-            return result
-
-        except Exception as e:
-            # Check if this exception should trigger the circuit breaker
-            if isinstance(e, self.expected_exception):
-                with self._lock:
-                    if current_state == CircuitBreakerState.HALF_OPEN:
-                        # Failed in half-open state, go back to open
-                        self._state = CircuitBreakerState.OPEN
-                        self._last_failure_time = time.time()
-                    else:
-                        # Record failure
-                        self._record_failure()
-
+                    # Failed in half-open state, go back to open
+                    self._state = CircuitBreakerState.OPEN
+                    self._mark_failure_time()
+                else:
+                    # Record failure
+                    self._record_failure()
             raise
 
+        # Success - reset if we were in half-open state
+        with self._lock:
+            if current_state == CircuitBreakerState.HALF_OPEN:
+                self._reset()
+
+        return result
+
     def get_state_info(self) -> Dict[str, Any]:
         """Get circuit breaker state information.
 
         Returns:
-            Dictionary with state information
+            Dictionary with state information. ``last_failure_time`` is a
+            wall-clock (epoch) timestamp regardless of the injected clock.
         """
         return {
             "state": self._state.value,
@@ -362,14 +384,17 @@ def retry(
 def circuit_breaker(
     failure_threshold: int = 5,
     recovery_timeout: float = 30.0,
-    expected_exception: Type[Exception] = Exception,
+    expected_exception: ExceptionTypes = Exception,
+    clock: Callable[[], float] = time.monotonic,
 ) -> Callable[[Callable[[], T]], Callable[[], T]]:
     """Decorator for adding circuit breaker to functions.
 
     Args:
         failure_threshold: Number of failures before opening circuit
         recovery_timeout: Time to wait before attempting recovery
-        expected_exception: Exception type that triggers circuit breaker
+        expected_exception: Exception type, or tuple of types, that triggers
+            circuit breaker
+        clock: Function returning the current time in seconds
 
     Returns:
         Decorator function
@@ -378,6 +403,7 @@ def circuit_breaker(
         failure_threshold=failure_threshold,
         recovery_timeout=recovery_timeout,
         expected_exception=expected_exception,
+        clock=clock,
     )
 
     def decorator(func: Callable[[], T]) -> Callable[[], T]:
@@ -0,0 +1,58 @@
+"""Shared pytest fixtures for the ghostctl test suite."""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+# Import the auth stack at conftest load so each xdist worker pays for
+# ghostctl.utils.auth, jwt and requests once.
+import jwt  # noqa: F401
+import requests  # noqa: F401
+
+import ghostctl.utils.auth as auth_module
+
+# Modules whose coverage tracing is skipped in the fast profile. Their lines
+# are still covered by the default run.
+FAST_NO_COVER_MODULES = ("tests/unit/test_auth.py",)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--fast",
+        action="store_true",
+        default=False,
+        help="fast profile: skip coverage tracing for mock-heavy test modules "
+        "(also enabled by GHOSTCTL_FAST_TESTS=1)",
+    )
+
+
+def _fast_profile(config):
+    """Whether the fast profile is on and pytest-cov is actually measuring."""
+    fast = config.getoption("--fast") or os.environ.get("GHOSTCTL_FAST_TESTS", "") not in ("", "0")
+    cov_active = bool(config.getoption("cov_source", default=None)) and not config.getoption(
+        "no_cov", default=False
+    )
+    return fast and cov_active
+
+
+def pytest_collection_modifyitems(config, items):
+    """Mark FAST_NO_COVER_MODULES with no_cover under the fast profile."""
+    if not _fast_profile(config):
+        return
+    for item in items:
+        if item.nodeid.startswith(FAST_NO_COVER_MODULES):
+            item.add_marker(pytest.mark.no_cover)
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    """Replace the clock used by ``ghostctl.utils.auth`` with a settable stub.
+
+    Yields a one-element list; tests set ``fake_time[0]`` to control the
+    value returned by ``time.time()`` inside the auth module.
+    """
+    now = [1000]
+    monkeypatch.setattr(auth_module, "time", SimpleNamespace(time=lambda: now[0]))
+    yield now
+
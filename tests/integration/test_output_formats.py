@@ -167,15 +167,18 @@ class TestOutputFormats:
             assert format_choice == 'json'
 
         # Test environment variable
+        output_formatter.invalidate_format_cache()
         with patch.dict('os.environ', {'GHOSTCTL_OUTPUT_FORMAT': 'yaml'}):
             format_choice = output_formatter.determine_format()
             assert format_choice == 'yaml'
 
         # Test terminal detection
+        output_formatter.invalidate_format_cache()
         with patch('sys.stdout.isatty', return_value=True):
             format_choice = output_formatter.determine_format()
             assert format_choice == 'table'  # Default for interactive terminal
 
+        output_formatter.invalidate_format_cache()
         with patch('sys.stdout.isatty', return_value=False):
             format_choice = output_formatter.determine_format()
             assert format_choice == 'json'  # Default for non-interactive
@@ -0,0 +1,65 @@
+"""Shared fixtures for the ghostctl unit tests."""
+
+from datetime import datetime, timezone
+from types import MappingProxyType
+
+import pytest
+
+from ghostctl.models import Post
+
+# Pre-built timestamp so fixtures skip ISO string parsing.
+_DT = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+# Read-only so tests sharing it through valid_post_data cannot mutate it.
+_POST_AUTHOR = MappingProxyType({
+    "id": "author_id",
+    "name": "John Doe",
+    "slug": "john-doe",
+    "email": "john@example.com",
+})
+
+_VALID_POST_DATA = MappingProxyType({
+    "id": "5f3d4a9b8c7e2f1a9b8c7e2f",
+    "uuid": "12345678-1234-5678-9012-123456789012",
+    "title": "Test Post",
+    "slug": "test-post",
+    "html": "<p>Test content</p>",
+    "status": "published",
+    "visibility": "public",
+    "created_at": _DT,
+    "updated_at": _DT,
+    "published_at": _DT,
+    "primary_author": _POST_AUTHOR,
+})
+
+_VALID_TAG_DATA = MappingProxyType({
+    "id": "tag_id",
+    "name": "Technology",
+    "slug": "technology",
+    "description": "Posts about technology",
+    "visibility": "public",
+    "created_at": _DT,
+    "updated_at": _DT,
+})
+
+
+@pytest.fixture
+def valid_post_data():
+    """Valid post data for testing.
+
+    A fresh top-level dict per test; the nested author mapping is shared
+    and read-only.
+    """
+    return dict(_VALID_POST_DATA)
+
+
+@pytest.fixture
+def valid_tag_data():
+    """Valid tag data for testing."""
+    return dict(_VALID_TAG_DATA)
+
+
+@pytest.fixture(scope="session")
+def sample_post():
+    """Validated Post shared by tests that only read its attributes."""
+    return Post(**_VALID_POST_DATA)
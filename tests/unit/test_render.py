@@ -6,16 +6,14 @@ including table, JSON, YAML formatting, field configuration, and file output.
 
 import sys
 import json
-import yaml
 import pytest
-import tempfile
-from pathlib import Path
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import Mock, patch
 from io import StringIO
 
 from rich.console import Console
 from rich.table import Table
 
+import ghostctl.render as render_module
 from ghostctl.render import OutputFormatter, render_table, render_json, render_yaml
 from ghostctl.exceptions import ValidationError
 
@@ -23,12 +21,19 @@ from ghostctl.exceptions import ValidationError
 class TestOutputFormatter:
     """Test cases for the OutputFormatter class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def formatter(self):
-        """Create an OutputFormatter instance."""
+        """Create an OutputFormatter instance shared across the module."""
         return OutputFormatter()
 
-    @pytest.fixture
+    @pytest.fixture(autouse=True)
+    def _reset_formatter(self, formatter):
+        """Clear per-test state left on the shared formatter."""
+        yield
+        formatter._custom_formatters.clear()
+        formatter.invalidate_format_cache()
+
+    @pytest.fixture(scope="module")
     def sample_data(self):
         """Sample data for testing."""
         return [
@@ -68,30 +73,48 @@ class TestOutputFormatter:
         assert formatter.determine_format("YAML") == "yaml"
         assert formatter.determine_format("Table") == "table"
 
-    @patch("sys.argv", ["ghostctl", "posts", "list", "--format", "yaml"])
-    def test_determine_format_command_line(self, formatter):
+    def test_determine_format_command_line(self, formatter, monkeypatch):
         """Test format determination from command line arguments."""
+        monkeypatch.setattr(sys, "argv", ["ghostctl", "posts", "list", "--format", "yaml"])
+        monkeypatch.delenv("GHOSTCTL_OUTPUT_FORMAT", raising=False)
         assert formatter.determine_format() == "yaml"
 
-    @patch("sys.argv", ["ghostctl", "posts", "list"])
-    @patch.dict("os.environ", {"GHOSTCTL_OUTPUT_FORMAT": "json"})
-    def test_determine_format_environment(self, formatter):
+    def test_determine_format_environment(self, formatter, monkeypatch):
         """Test format determination from environment variable."""
+        monkeypatch.setattr(sys, "argv", ["ghostctl", "posts", "list"])
+        monkeypatch.setenv("GHOSTCTL_OUTPUT_FORMAT", "json")
         assert formatter.determine_format() == "json"
 
-    @patch("sys.argv", ["ghostctl", "posts", "list"])
-    @patch.dict("os.environ", {}, clear=True)
-    def test_determine_format_auto_detect_tty(self, formatter):
+    def test_determine_format_auto_detect_tty(self, formatter, monkeypatch):
         """Test format auto-detection for TTY."""
-        with patch("sys.stdout.isatty", return_value=True):
-            assert formatter.determine_format() == "table"
+        monkeypatch.setattr(sys, "argv", ["ghostctl", "posts", "list"])
+        monkeypatch.delenv("GHOSTCTL_OUTPUT_FORMAT", raising=False)
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+        assert formatter.determine_format() == "table"
 
-    @patch("sys.argv", ["ghostctl", "posts", "list"])
-    @patch.dict("os.environ", {}, clear=True)
-    def test_determine_format_auto_detect_non_tty(self, formatter):
+    def test_determine_format_auto_detect_non_tty(self, formatter, monkeypatch):
         """Test format auto-detection for non-TTY."""
-        with patch("sys.stdout.isatty", return_value=False):
-            assert formatter.determine_format() == "json"
+        monkeypatch.setattr(sys, "argv", ["ghostctl", "posts", "list"])
+        monkeypatch.delenv("GHOSTCTL_OUTPUT_FORMAT", raising=False)
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: False)
+        assert formatter.determine_format() == "json"
+
+    def test_determine_format_cached(self, formatter, monkeypatch):
+        """Test format is resolved once and cached until invalidated."""
+        monkeypatch.delenv("GHOSTCTL_OUTPUT_FORMAT", raising=False)
+        monkeypatch.setattr(sys, "argv", ["ghostctl", "--format", "yaml"])
+        assert formatter.determine_format() == "yaml"
+
+        monkeypatch.setattr(sys, "argv", ["ghostctl", "--format", "json"])
+        assert formatter.determine_format() == "yaml"
+        formatter.invalidate_format_cache()
+        assert formatter.determine_format() == "json"
+
+    def test_set_format(self, formatter):
+        """Test set_format replaces the cached format."""
+        formatter.set_format("YAML")
+        assert formatter.determine_format() == "yaml"
+        assert formatter.determine_format("table") == "table"
 
     def test_render_table_format(self, formatter, sample_data):
         """Test rendering with table format."""
@@ -193,12 +216,12 @@ class TestOutputFormatter:
         captured = capsys.readouterr()
         assert captured.out.strip() == "[]"
 
-    def test_render_json_simple_data(self, formatter, sample_data, capsys):
+    def test_render_json_simple_data(self, formatter, sample_data):
         """Test rendering JSON with simple data."""
-        formatter.render_json(sample_data)
+        buffer = StringIO()
+        formatter.render_json(sample_data, stream=buffer)
 
-        captured = capsys.readouterr()
-        output_data = json.loads(captured.out)
+        output_data = json.loads(buffer.getvalue())
         assert len(output_data) == 2
         assert output_data[0]["title"] == "First Post"
 
@@ -229,22 +252,47 @@ class TestOutputFormatter:
         assert captured.out.startswith("[")
         assert captured.out.endswith("\n]")
 
-    def test_render_json_skip_invalid(self, formatter, capsys):
+    def test_render_json_skip_invalid(self, formatter):
         """Test rendering JSON with skip_invalid option."""
         data_with_none = [{"id": "1"}, None, {"id": "2"}]
 
-        formatter.render_json(data_with_none, skip_invalid=True)
+        buffer = StringIO()
+        formatter.render_json(data_with_none, skip_invalid=True, stream=buffer)
 
-        captured = capsys.readouterr()
-        output_data = json.loads(captured.out)
+        output_data = json.loads(buffer.getvalue())
         assert len(output_data) == 2
         assert all(item is not None for item in output_data)
 
     def test_render_json_circular_reference_error(self, formatter):
         """Test rendering JSON with circular reference."""
-        with patch("json.dumps", side_effect=ValueError("circular reference detected")):
-            with pytest.raises(ValidationError, match="Circular reference detected"):
-                formatter.render_json({"data": "test"})
+        data = {"data": "test"}
+        data["self"] = data
+
+        with pytest.raises(ValidationError, match="Circular reference detected"):
+            formatter.render_json(data)
+
+    def test_render_json_compact_format(self, formatter):
+        """Test compact JSON keeps the stdlib separators and NaN handling."""
+        buffer = StringIO()
+        formatter.render_json({"a": 1, "b": [1, 2], "c": float("nan")}, pretty=False, stream=buffer)
+
+        assert buffer.getvalue() == '{"a": 1, "b": [1, 2], "c": NaN}\n'
+
+    def test_render_json_pretty_format(self, formatter):
+        """Test pretty JSON layout and NaN/enum/float output."""
+        import enum
+
+        class Color(enum.Enum):
+            RED = "red"
+
+        data = {"a": 1, "b": [1e-07, 1e16], "c": float("nan"), "d": Color.RED}
+        buffer = StringIO()
+        formatter.render_json(data, stream=buffer)
+
+        assert buffer.getvalue() == (
+            '{\n  "a": 1,\n  "b": [\n    1e-07,\n    1e+16\n  ],\n'
+            '  "c": NaN,\n  "d": "Color.RED"\n}\n'
+        )
 
     def test_render_yaml_empty_data(self, formatter, capsys):
         """Test rendering YAML with empty data."""
@@ -253,15 +301,31 @@ class TestOutputFormatter:
         captured = capsys.readouterr()
         assert captured.out.strip() == "[]"
 
-    def test_render_yaml_simple_data(self, formatter, sample_data, capsys):
+    def test_render_yaml_simple_data(self, formatter, sample_data):
         """Test rendering YAML with simple data."""
-        formatter.render_yaml(sample_data)
+        import yaml
 
-        captured = capsys.readouterr()
-        output_data = yaml.safe_load(captured.out)
+        buffer = StringIO()
+        formatter.render_yaml(sample_data, stream=buffer)
+
+        output_data = yaml.safe_load(buffer.getvalue())
         assert len(output_data) == 2
         assert output_data[0]["title"] == "First Post"
 
+    def test_render_yaml_arbitrary_objects(self, formatter):
+        """Test YAML output accepts values the safe dumper rejects."""
+        from decimal import Decimal
+        from enum import Enum
+
+        class Status(str, Enum):
+            DRAFT = "draft"
+
+        buffer = StringIO()
+        formatter.render_yaml({"price": Decimal("1.50"), "status": Status.DRAFT}, stream=buffer)
+
+        assert "price:" in buffer.getvalue()
+        assert "status:" in buffer.getvalue()
+
     def test_render_yaml_with_metadata(self, formatter, sample_data, capsys):
         """Test rendering YAML with metadata."""
         with patch.object(formatter, "_get_timestamp", return_value="2023-01-01T00:00:00"):
@@ -282,71 +346,55 @@ class TestOutputFormatter:
 
     def test_render_yaml_error(self, formatter):
         """Test rendering YAML with serialization error."""
+        import yaml
+
         with patch("yaml.dump", side_effect=yaml.YAMLError("YAML error")):
             with pytest.raises(ValidationError, match="Failed to serialize data to YAML"):
                 formatter.render_yaml({"data": "test"})
 
-    def test_render_to_file_json(self, formatter, sample_data):
+    def test_render_to_file_json(self, formatter, sample_data, tmp_path):
         """Test rendering to JSON file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp_file:
-            temp_path = tmp_file.name
+        temp_path = tmp_path / "out.json"
 
-        try:
-            formatter.render_to_file(sample_data, temp_path)
+        formatter.render_to_file(sample_data, temp_path)
 
-            with open(temp_path, "r") as f:
-                file_data = json.load(f)
-                assert len(file_data) == 2
-                assert file_data[0]["title"] == "First Post"
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        file_data = json.loads(temp_path.read_text())
+        assert len(file_data) == 2
+        assert file_data[0]["title"] == "First Post"
 
-    def test_render_to_file_yaml(self, formatter, sample_data):
+    def test_render_to_file_yaml(self, formatter, sample_data, tmp_path):
         """Test rendering to YAML file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as tmp_file:
-            temp_path = tmp_file.name
+        import yaml
 
-        try:
-            formatter.render_to_file(sample_data, temp_path)
+        temp_path = tmp_path / "out.yaml"
 
-            with open(temp_path, "r") as f:
-                file_data = yaml.safe_load(f)
-                assert len(file_data) == 2
-                assert file_data[0]["title"] == "First Post"
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        formatter.render_to_file(sample_data, temp_path)
 
-    def test_render_to_file_explicit_format(self, formatter, sample_data):
+        file_data = yaml.safe_load(temp_path.read_text())
+        assert len(file_data) == 2
+        assert file_data[0]["title"] == "First Post"
+
+    def test_render_to_file_explicit_format(self, formatter, sample_data, tmp_path):
         """Test rendering to file with explicit format."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as tmp_file:
-            temp_path = tmp_file.name
+        temp_path = tmp_path / "out.txt"
 
-        try:
-            formatter.render_to_file(sample_data, temp_path, format="json")
+        formatter.render_to_file(sample_data, temp_path, format="json")
 
-            with open(temp_path, "r") as f:
-                file_data = json.load(f)
-                assert len(file_data) == 2
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        file_data = json.loads(temp_path.read_text())
+        assert len(file_data) == 2
 
-    def test_render_to_file_append_mode(self, formatter, sample_data):
+    def test_render_to_file_append_mode(self, formatter, sample_data, tmp_path):
         """Test rendering to file in append mode."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp_file:
-            temp_path = tmp_file.name
-            # Write initial data
-            json.dump({"existing": "data"}, tmp_file)
-
-        try:
-            formatter.render_to_file(sample_data, temp_path, append=True)
-
-            with open(temp_path, "r") as f:
-                content = f.read()
-                # Should contain both original and new data
-                assert '{"existing": "data"}' in content
-                assert '"First Post"' in content
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        temp_path = tmp_path / "out.json"
+        # Write initial data
+        temp_path.write_text(json.dumps({"existing": "data"}))
+
+        formatter.render_to_file(sample_data, temp_path, append=True)
+
+        content = temp_path.read_text()
+        # Should contain both original and new data
+        assert '{"existing": "data"}' in content
+        assert '"First Post"' in content
 
     def test_register_format(self, formatter):
         """Test registering custom format."""
@@ -384,6 +432,15 @@ class TestOutputFormatter:
         table = mock_print.call_args[0][0]
         assert isinstance(table, Table)
 
+    def test_build_row_template(self, formatter):
+        """Test _build_row_template formats cells for the bound columns."""
+        row_template = formatter._build_row_template(["title", "featured", "tags", "missing"])
+
+        row = row_template({"title": "Post", "featured": True, "tags": ["a"], "missing": None})
+
+        assert row == ["Post", "✓", "['a']", ""]
+        assert row_template({"featured": False}) == ["", "✗", "", ""]
+
     def test_render_table_data_without_colors(self, formatter, sample_data):
         """Test _render_table_data without colors."""
         with patch.object(formatter, "_strip_ansi", return_value="plain text") as mock_strip:
@@ -393,6 +450,15 @@ class TestOutputFormatter:
         mock_strip.assert_called_once()
         mock_print.assert_called_once_with("plain text")
 
+    def test_render_table_data_cells_not_markup(self, formatter):
+        """Test _render_table_data renders bracketed cell text literally."""
+        data = [{"title": "[bold]Literal[/bold]"}]
+
+        with patch("builtins.print") as mock_print:
+            formatter._render_table_data(data, colors=False)
+
+        assert "[bold]Literal[/bold]" in mock_print.call_args[0][0]
+
     def test_render_paginated_table_interactive(self, formatter, sample_data):
         """Test _render_paginated_table in interactive mode."""
         with patch.object(formatter, "_render_table_data"):
@@ -403,6 +469,16 @@ class TestOutputFormatter:
                     interactive=True,
                 )
 
+    def test_render_paginated_table_iterator(self, formatter, sample_data):
+        """Test _render_paginated_table pages through a one-shot iterator."""
+        rows = (dict(item, id=str(i)) for i, item in enumerate(sample_data * 3))
+
+        with patch.object(formatter, "_render_table_data") as mock_render:
+            formatter._render_paginated_table(rows, page_size=4, interactive=False)
+
+        assert [len(call.args[0]) for call in mock_render.call_args_list] == [4, 2]
+        assert mock_render.call_args_list[1].kwargs["title"] == "Page 2"
+
     def test_apply_field_config_include_fields(self, formatter, sample_data):
         """Test _apply_field_config with include fields."""
         config = {"include": ["id", "title"]}
@@ -486,6 +562,27 @@ class TestOutputFormatter:
         assert result[0]["title"] == "Second Post"
         assert result[1]["title"] == "First Post"
 
+    def test_sort_data_mixed_directions(self, formatter):
+        """Test _sort_data applies each field's direction independently."""
+        data = [
+            {"status": "published", "title": "Alpha"},
+            {"status": "draft", "title": "Beta"},
+            {"status": "published", "title": "Gamma"},
+            {"status": "draft", "title": "Delta"},
+        ]
+
+        result = formatter._sort_data(data, [("status", "asc"), ("title", "desc")])
+
+        assert [item["title"] for item in result] == ["Delta", "Beta", "Gamma", "Alpha"]
+
+    def test_sort_data_missing_field(self, formatter):
+        """Test _sort_data treats a missing sort field as empty."""
+        data = [{"title": "B"}, {"id": "no-title"}, {"title": "A"}]
+
+        result = formatter._sort_data(data, [("title", "asc")])
+
+        assert [item.get("title") for item in result] == [None, "A", "B"]
+
     def test_group_data(self, formatter, sample_data):
         """Test _group_data functionality."""
         result = formatter._group_data(sample_data, "status")
@@ -496,6 +593,20 @@ class TestOutputFormatter:
         assert len(result["draft"]) == 1
         assert result["published"][0]["title"] == "First Post"
 
+    def test_group_data_nested_field(self, formatter):
+        """Test _group_data with a dotted field name."""
+        data = [
+            {"id": "1", "author": {"name": "John"}},
+            {"id": "2", "author": {"name": "Jane"}},
+            {"id": "3", "author": {"name": "John"}},
+            {"id": "4"},
+        ]
+
+        result = formatter._group_data(data, "author.name")
+
+        assert list(result) == ["John", "Jane", "Unknown"]
+        assert [item["id"] for item in result["John"]] == ["1", "3"]
+
     def test_get_nested_value(self, formatter):
         """Test _get_nested_value functionality."""
         data = {
@@ -512,14 +623,19 @@ class TestOutputFormatter:
         assert formatter._get_nested_value(data, "user.nonexistent") is None
         assert formatter._get_nested_value(data, "nonexistent.path") is None
 
-    def test_get_timestamp(self, formatter):
+    def test_get_timestamp(self, formatter, monkeypatch):
         """Test _get_timestamp functionality."""
+        monkeypatch.setattr(render_module, "_TS_CACHE", [float("-inf"), ""])
         with patch("datetime.datetime") as mock_datetime:
             mock_datetime.now.return_value.isoformat.return_value = "2023-01-01T00:00:00"
 
             timestamp = formatter._get_timestamp()
             assert timestamp == "2023-01-01T00:00:00"
 
+            # Within the TTL the cached value is reused
+            mock_datetime.now.return_value.isoformat.return_value = "2023-01-01T00:00:01"
+            assert formatter._get_timestamp() == "2023-01-01T00:00:00"
+
     def test_strip_ansi(self, formatter):
         """Test _strip_ansi functionality."""
         text_with_ansi = "\x1b[31mRed text\x1b[0m normal text"
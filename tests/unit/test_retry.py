@@ -4,10 +4,12 @@ Tests the RetryManager and CircuitBreaker classes for retry logic
 including exponential backoff, jitter, circuit breaker patterns, and decorators.
 """
 
-import time
+import importlib.util
 import threading
 import pytest
-from unittest.mock import Mock, patch, call
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
 from requests.exceptions import ConnectionError, Timeout, HTTPError
 
@@ -21,13 +23,128 @@ from ghostctl.utils.retry import (
 from ghostctl.exceptions import MaxRetriesExceededError, CircuitBreakerOpenError
 
 
+class FakeClock:
+    """Manually advanced clock for circuit breaker recovery timing."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+# Worker threads in the shared pool; concurrency tests that line their
+# calls up on a barrier can use at most this many parties.
+POOL_SIZE = 64
+
+
+@pytest.fixture(scope="module")
+def thread_pool():
+    """Thread pool shared by the concurrency tests in this module."""
+    with ThreadPoolExecutor(max_workers=POOL_SIZE) as pool:
+        yield pool
+
+
+@pytest.fixture(scope="module")
+def http_errors():
+    """HTTPError instances keyed by the status code of their response."""
+    errors = {}
+    for status_code in (400, 401, 403, 404, 429, 500, 502, 503, 504):
+        error = HTTPError()
+        error.response = SimpleNamespace(status_code=status_code)
+        errors[status_code] = error
+    return errors
+
+
+# Hot-path microbenchmarks need the pytest-benchmark plugin
+requires_benchmark = pytest.mark.skipif(
+    importlib.util.find_spec("pytest_benchmark") is None,
+    reason="pytest-benchmark is not installed",
+)
+
+
+def _sequence(*outcomes):
+    """Operation that raises or returns each outcome in turn.
+
+    Cheaper than ``Mock(side_effect=[...])``; calls are recorded on
+    ``.calls``.
+    """
+    remaining = iter(outcomes)
+    calls = []
+
+    def operation(*args, **kwargs):
+        calls.append((args, kwargs))
+        outcome = next(remaining)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    operation.calls = calls
+    return operation
+
+
+METRIC_KEYS = (
+    "total_operations",
+    "successful_operations",
+    "failed_operations",
+    "total_retry_attempts",
+)
+
+
+def _counters(metrics):
+    """The operation and retry counters from a metrics dict."""
+    return {key: metrics[key] for key in METRIC_KEYS}
+
+
+def _always_fail():
+    raise Exception("Test error")
+
+
+def _drive_failures(breaker, count):
+    """Make ``count`` calls through ``breaker`` that each raise."""
+    for _ in range(count):
+        try:
+            breaker.call(_always_fail)
+        except Exception:
+            pass
+        else:
+            pytest.fail("call through the breaker did not raise")
+
+
+@pytest.fixture(autouse=True)
+def sleep_calls(monkeypatch):
+    """Record retry backoff sleeps instead of sleeping."""
+    calls = []
+    monkeypatch.setattr("ghostctl.utils.retry.time.sleep", calls.append)
+    return calls
+
+
+@pytest.fixture(scope="module")
+def manager():
+    """Default-configured RetryManager shared by the module."""
+    return RetryManager()
+
+
+@pytest.fixture(scope="module")
+def breaker():
+    """Default-configured CircuitBreaker shared by the module."""
+    return CircuitBreaker()
+
+
 class TestRetryManager:
     """Test cases for the RetryManager class."""
 
-    def test_retry_manager_initialization_defaults(self):
-        """Test RetryManager initialization with default values."""
-        manager = RetryManager()
+    @pytest.fixture(autouse=True)
+    def _reset_manager(self, manager):
+        """Clear metrics left on the shared manager."""
+        yield
+        manager.reset_metrics()
 
+    def test_retry_manager_initialization_defaults(self, manager):
+        """Test RetryManager initialization with default values."""
         assert manager.max_retries == 3
         assert manager.base_delay == 1.0
         assert manager.max_delay == 60.0
@@ -35,11 +152,12 @@ class TestRetryManager:
         assert manager.jitter is True
 
         # Check metrics initialization
-        metrics = manager.get_metrics()
-        assert metrics["total_operations"] == 0
-        assert metrics["successful_operations"] == 0
-        assert metrics["failed_operations"] == 0
-        assert metrics["total_retry_attempts"] == 0
+        assert _counters(manager.get_metrics()) == {
+            "total_operations": 0,
+            "successful_operations": 0,
+            "failed_operations": 0,
+            "total_retry_attempts": 0,
+        }
 
     def test_retry_manager_initialization_custom(self):
         """Test RetryManager initialization with custom values."""
@@ -71,35 +189,21 @@ class TestRetryManager:
         assert manager.should_retry(ValueError("test")) is True
         assert manager.should_retry(TypeError("test")) is False  # Default conditions
 
-    def test_should_retry_default_conditions(self):
+    def test_should_retry_default_conditions(self, manager, http_errors):
         """Test default retry conditions."""
-        manager = RetryManager()
-
         # Should retry on network errors
         assert manager.should_retry(ConnectionError("Network error")) is True
         assert manager.should_retry(Timeout("Request timeout")) is True
 
-        # Should retry on 5xx HTTP errors
-        response_500 = Mock()
-        response_500.status_code = 500
-        http_error_500 = HTTPError()
-        http_error_500.response = response_500
-        assert manager.should_retry(http_error_500) is True
-
-        # Should not retry on 4xx HTTP errors
-        response_400 = Mock()
-        response_400.status_code = 400
-        http_error_400 = HTTPError()
-        http_error_400.response = response_400
-        assert manager.should_retry(http_error_400) is False
+        # Should retry on 5xx HTTP errors only
+        for status_code, error in http_errors.items():
+            assert manager.should_retry(error) is (status_code >= 500), status_code
 
         # Should not retry on other exceptions
         assert manager.should_retry(ValueError("Not retryable")) is False
 
-    def test_should_retry_http_error_no_response(self):
+    def test_should_retry_http_error_no_response(self, manager):
         """Test should_retry with HTTPError that has no response."""
-        manager = RetryManager()
-
         http_error = HTTPError()
         http_error.response = None
         assert manager.should_retry(http_error) is False
@@ -113,36 +217,23 @@ class TestRetryManager:
             jitter=False,
         )
 
-        # Test exponential backoff
-        assert manager.calculate_delay(0) == 2.0  # 2.0 * 3^0
-        assert manager.calculate_delay(1) == 6.0  # 2.0 * 3^1
-        assert manager.calculate_delay(2) == 18.0  # 2.0 * 3^2
-
-        # Test max delay limit
-        assert manager.calculate_delay(3) == 30.0  # Should be capped at max_delay
+        # 2.0 * 3^attempt, capped at max_delay from attempt 3 onwards
+        expected = [min(2.0 * 3.0 ** attempt, 30.0) for attempt in range(10)]
+        assert expected[:4] == [2.0, 6.0, 18.0, 30.0]
+        assert [manager.calculate_delay(attempt) for attempt in range(10)] == pytest.approx(expected)
 
     def test_calculate_delay_with_jitter(self):
         """Test delay calculation with jitter."""
         manager = RetryManager(base_delay=1.0, jitter=True)
 
-        with patch("random.random", return_value=0.5):
-            delay = manager.calculate_delay(0)
-            # Base delay (1.0) + jitter (1.0 * 0.5) = 1.5
-            assert delay == 1.5
-
-        with patch("random.random", return_value=0.0):
-            delay = manager.calculate_delay(0)
-            # Base delay (1.0) + jitter (1.0 * 0.0) = 1.0
-            assert delay == 1.0
-
-        with patch("random.random", return_value=1.0):
-            delay = manager.calculate_delay(0)
-            # Base delay (1.0) + jitter (1.0 * 1.0) = 2.0
-            assert delay == 2.0
+        # Jitter adds between 0% and 100% of the base delay: 1.0 + 1.0 * r
+        with patch("random.random", side_effect=[0.5, 0.0, 1.0]):
+            assert manager.calculate_delay(0) == 1.5
+            assert manager.calculate_delay(0) == 1.0
+            assert manager.calculate_delay(0) == 2.0
 
-    def test_execute_with_retry_success_first_attempt(self):
+    def test_execute_with_retry_success_first_attempt(self, manager):
         """Test successful operation on first attempt."""
-        manager = RetryManager()
         operation = Mock(return_value="success")
 
         result = manager.execute_with_retry(operation)
@@ -151,31 +242,32 @@ class TestRetryManager:
         operation.assert_called_once()
 
         # Check metrics
-        metrics = manager.get_metrics()
-        assert metrics["total_operations"] == 1
-        assert metrics["successful_operations"] == 1
-        assert metrics["failed_operations"] == 0
-        assert metrics["total_retry_attempts"] == 0
+        assert _counters(manager.get_metrics()) == {
+            "total_operations": 1,
+            "successful_operations": 1,
+            "failed_operations": 0,
+            "total_retry_attempts": 0,
+        }
 
     def test_execute_with_retry_success_after_retries(self):
         """Test successful operation after some retries."""
         manager = RetryManager(max_retries=3, base_delay=0.01)  # Small delay for tests
 
         # Fail twice, then succeed
-        operation = Mock(side_effect=[ConnectionError(), ConnectionError(), "success"])
+        operation = _sequence(ConnectionError(), ConnectionError(), "success")
 
-        with patch("time.sleep"):  # Mock sleep to speed up test
-            result = manager.execute_with_retry(operation)
+        result = manager.execute_with_retry(operation)
 
         assert result == "success"
-        assert operation.call_count == 3
+        assert len(operation.calls) == 3
 
         # Check metrics
-        metrics = manager.get_metrics()
-        assert metrics["total_operations"] == 1
-        assert metrics["successful_operations"] == 1
-        assert metrics["failed_operations"] == 0
-        assert metrics["total_retry_attempts"] == 2
+        assert _counters(manager.get_metrics()) == {
+            "total_operations": 1,
+            "successful_operations": 1,
+            "failed_operations": 0,
+            "total_retry_attempts": 2,
+        }
 
     def test_execute_with_retry_max_retries_exceeded(self):
         """Test operation failing after max retries."""
@@ -184,25 +276,23 @@ class TestRetryManager:
         # Always fail
         operation = Mock(side_effect=ConnectionError("Always fails"))
 
-        with patch("time.sleep"):
-            with pytest.raises(MaxRetriesExceededError) as exc_info:
-                manager.execute_with_retry(operation)
+        with pytest.raises(MaxRetriesExceededError) as exc_info:
+            manager.execute_with_retry(operation)
 
         assert exc_info.value.attempts == 3  # max_retries + 1
         assert isinstance(exc_info.value.last_exception, ConnectionError)
         assert operation.call_count == 3
 
         # Check metrics
-        metrics = manager.get_metrics()
-        assert metrics["total_operations"] == 1
-        assert metrics["successful_operations"] == 0
-        assert metrics["failed_operations"] == 1
-        assert metrics["total_retry_attempts"] == 2
-
-    def test_execute_with_retry_non_retryable_exception(self):
+        assert _counters(manager.get_metrics()) == {
+            "total_operations": 1,
+            "successful_operations": 0,
+            "failed_operations": 1,
+            "total_retry_attempts": 2,
+        }
+
+    def test_execute_with_retry_non_retryable_exception(self, manager):
         """Test operation failing with non-retryable exception."""
-        manager = RetryManager()
-
         # Non-retryable exception
         operation = Mock(side_effect=ValueError("Not retryable"))
 
@@ -213,30 +303,35 @@ class TestRetryManager:
         operation.assert_called_once()  # No retries
 
         # Check metrics
-        metrics = manager.get_metrics()
-        assert metrics["total_operations"] == 1
-        assert metrics["successful_operations"] == 0
-        assert metrics["failed_operations"] == 1
-        assert metrics["total_retry_attempts"] == 0
-
-    def test_execute_with_retry_delay_calculation(self):
+        assert _counters(manager.get_metrics()) == {
+            "total_operations": 1,
+            "successful_operations": 0,
+            "failed_operations": 1,
+            "total_retry_attempts": 0,
+        }
+
+    def test_execute_with_retry_delay_calculation(self, sleep_calls, monkeypatch):
         """Test that delays are calculated and applied correctly."""
         manager = RetryManager(max_retries=2, base_delay=1.0, jitter=False)
 
-        operation = Mock(side_effect=[ConnectionError(), ConnectionError(), "success"])
+        operation = _sequence(ConnectionError(), ConnectionError(), "success")
+
+        attempts = []
 
-        with patch("time.sleep") as mock_sleep:
-            with patch.object(manager, "calculate_delay", side_effect=[1.0, 2.0]) as mock_calc:
-                result = manager.execute_with_retry(operation)
+        def fake_calculate_delay(attempt):
+            attempts.append(attempt)
+            return (1.0, 2.0)[attempt]
+
+        monkeypatch.setattr(manager, "calculate_delay", fake_calculate_delay)
+
+        result = manager.execute_with_retry(operation)
 
         assert result == "success"
-        mock_calc.assert_has_calls([call(0), call(1)])
-        mock_sleep.assert_has_calls([call(1.0), call(2.0)])
+        assert attempts == [0, 1]
+        assert sleep_calls == [1.0, 2.0]
 
-    def test_get_metrics_with_calculations(self):
+    def test_get_metrics_with_calculations(self, manager):
         """Test metrics with calculated fields."""
-        manager = RetryManager()
-
         # Simulate some operations
         manager._metrics.update({
             "total_operations": 10,
@@ -252,20 +347,16 @@ class TestRetryManager:
         assert metrics["failure_rate"] == 0.3
         assert metrics["average_retry_delay"] == 3.0  # 45.0 / 15
 
-    def test_get_metrics_zero_operations(self):
+    def test_get_metrics_zero_operations(self, manager):
         """Test metrics when no operations have been performed."""
-        manager = RetryManager()
-
         metrics = manager.get_metrics()
 
         assert metrics["success_rate"] == 0.0
         assert metrics["failure_rate"] == 0.0
         assert metrics["average_retry_delay"] == 0.0
 
-    def test_reset_metrics(self):
+    def test_reset_metrics(self, manager):
         """Test resetting metrics."""
-        manager = RetryManager()
-
         # Set some metrics
         manager._metrics.update({
             "total_operations": 5,
@@ -285,10 +376,14 @@ class TestRetryManager:
 class TestCircuitBreaker:
     """Test cases for the CircuitBreaker class."""
 
-    def test_circuit_breaker_initialization_defaults(self):
-        """Test CircuitBreaker initialization with defaults."""
-        breaker = CircuitBreaker()
+    @pytest.fixture(autouse=True)
+    def _reset_breaker(self, breaker):
+        """Close the shared breaker after each test."""
+        yield
+        breaker.reset()
 
+    def test_circuit_breaker_initialization_defaults(self, breaker):
+        """Test CircuitBreaker initialization with defaults."""
         assert breaker.failure_threshold == 5
         assert breaker.recovery_timeout == 30.0
         assert breaker.expected_exception == Exception
@@ -306,9 +401,8 @@ class TestCircuitBreaker:
         assert breaker.recovery_timeout == 60.0
         assert breaker.expected_exception == ConnectionError
 
-    def test_circuit_breaker_successful_call(self):
+    def test_circuit_breaker_successful_call(self, breaker):
         """Test successful call through circuit breaker."""
-        breaker = CircuitBreaker()
         operation = Mock(return_value="success")
 
         result = breaker.call(operation)
@@ -317,107 +411,70 @@ class TestCircuitBreaker:
         operation.assert_called_once()
         assert breaker.state == "closed"
 
-    def test_circuit_breaker_failure_under_threshold(self):
-        """Test failures under threshold keep circuit closed."""
-        breaker = CircuitBreaker(failure_threshold=3)
-
-        # Fail twice (under threshold)
-        for _ in range(2):
-            operation = Mock(side_effect=Exception("Test error"))
-            with pytest.raises(Exception):
-                breaker.call(operation)
-
-        # Should still be closed
-        assert breaker.state == "closed"
-        state_info = breaker.get_state_info()
-        assert state_info["failure_count"] == 2
-
-    def test_circuit_breaker_failure_at_threshold(self):
-        """Test circuit opens when failure threshold is reached."""
-        breaker = CircuitBreaker(failure_threshold=3)
-
-        # Fail exactly at threshold
-        for _ in range(3):
-            operation = Mock(side_effect=Exception("Test error"))
-            with pytest.raises(Exception):
+    @pytest.mark.parametrize(
+        "scenario",
+        [
+            pytest.param(
+                {"threshold": 3, "failures": 2, "state": "closed", "failure_count": 2},
+                id="failure_under_threshold",
+            ),
+            pytest.param(
+                {"threshold": 3, "failures": 3, "state": "open", "failure_count": 3},
+                id="failure_at_threshold",
+            ),
+            pytest.param(
+                {"threshold": 1, "failures": 1, "state": "open", "failure_count": 1},
+                id="open_after_single_failure",
+            ),
+        ],
+    )
+    def test_circuit_breaker_state_transitions(self, scenario):
+        """Test the circuit state after a run of failures."""
+        breaker = CircuitBreaker(failure_threshold=scenario["threshold"])
+
+        _drive_failures(breaker, scenario["failures"])
+
+        # An open circuit rejects calls without running them
+        operation = Mock(return_value="success")
+        if scenario["state"] == "open":
+            with pytest.raises(CircuitBreakerOpenError):
                 breaker.call(operation)
+            operation.assert_not_called()
 
-        # Should be open now
-        assert breaker.state == "open"
-        state_info = breaker.get_state_info()
-        assert state_info["failure_count"] == 3
+        assert breaker.state == scenario["state"]
+        assert breaker.get_state_info()["failure_count"] == scenario["failure_count"]
 
-    def test_circuit_breaker_open_rejects_calls(self):
-        """Test open circuit breaker rejects calls."""
-        breaker = CircuitBreaker(failure_threshold=1)
-
-        # Trigger circuit to open
-        operation = Mock(side_effect=Exception("Test error"))
-        with pytest.raises(Exception):
-            breaker.call(operation)
+    def test_circuit_breaker_recovery_state_machine(self):
+        """Test open, half-open and closed transitions over one breaker's lifetime."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.1, clock=clock)
 
+        # A failure opens the circuit and further calls are rejected
+        _drive_failures(breaker, 1)
         assert breaker.state == "open"
-
-        # Next call should be rejected
         with pytest.raises(CircuitBreakerOpenError):
             breaker.call(Mock(return_value="success"))
 
-    def test_circuit_breaker_half_open_after_timeout(self):
-        """Test circuit breaker transitions to half-open after timeout."""
-        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.1)
-
-        # Trigger circuit to open
-        operation = Mock(side_effect=Exception("Test error"))
-        with pytest.raises(Exception):
-            breaker.call(operation)
-
-        assert breaker.state == "open"
-
-        # Wait for recovery timeout
-        time.sleep(0.2)
-
-        # Next call should transition to half-open
-        operation = Mock(return_value="success")
-        result = breaker.call(operation)
-
-        assert result == "success"
-        assert breaker.state == "closed"  # Should reset on success
-
-    def test_circuit_breaker_half_open_success_resets(self):
-        """Test half-open circuit resets to closed on success."""
-        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.1)
-
-        # Open the circuit
-        with pytest.raises(Exception):
-            breaker.call(Mock(side_effect=Exception("Error")))
-
-        # Wait and try again
-        time.sleep(0.2)
-
-        # Successful call should reset circuit
-        result = breaker.call(Mock(return_value="success"))
-        assert result == "success"
+        # After the recovery timeout a successful half-open call closes it
+        clock.advance(0.2)
+        assert breaker.call(Mock(return_value="success")) == "success"
         assert breaker.state == "closed"
+        assert breaker.get_state_info()["failure_count"] == 0
 
-        state_info = breaker.get_state_info()
-        assert state_info["failure_count"] == 0
-
-    def test_circuit_breaker_half_open_failure_reopens(self):
-        """Test half-open circuit goes back to open on failure."""
-        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.1)
-
-        # Open the circuit
-        with pytest.raises(Exception):
-            breaker.call(Mock(side_effect=Exception("Error")))
-
-        # Wait and try again with failure
-        time.sleep(0.2)
-
-        with pytest.raises(Exception):
+        # A failed half-open call reopens it and restarts the timeout
+        _drive_failures(breaker, 1)
+        clock.advance(0.2)
+        with pytest.raises(Exception, match="Still failing"):
             breaker.call(Mock(side_effect=Exception("Still failing")))
-
-        # Should be open again
         assert breaker.state == "open"
+        assert breaker.get_state_info()["failure_count"] == 1
+        with pytest.raises(CircuitBreakerOpenError):
+            breaker.call(Mock(return_value="success"))
+
+        # Recovery works again once the new timeout has passed
+        clock.advance(0.2)
+        assert breaker.call(Mock(return_value="success")) == "success"
+        assert breaker.state == "closed"
 
     def test_circuit_breaker_non_expected_exception(self):
         """Test circuit breaker doesn't trigger on unexpected exceptions."""
@@ -455,31 +512,71 @@ class TestCircuitBreaker:
         state_info = breaker.get_state_info()
         assert state_info["failure_count"] == 1
 
-    def test_circuit_breaker_thread_safety(self):
-        """Test circuit breaker thread safety."""
-        breaker = CircuitBreaker(failure_threshold=10)
-        results = []
-        exceptions = []
+    def test_circuit_breaker_expected_exception_tuple(self):
+        """Test circuit breaker accepts a tuple of expected exception types."""
+        breaker = CircuitBreaker(
+            failure_threshold=3,
+            expected_exception=(ConnectionError, Timeout),
+        )
+
+        for exc in (ConnectionError("Network error"), Timeout("Timed out"), ValueError("Other")):
+            with pytest.raises(type(exc)):
+                breaker.call(Mock(side_effect=exc))
 
-        def worker():
+        # Only the two expected types were counted
+        assert breaker.state == "closed"
+        assert breaker.get_state_info()["failure_count"] == 2
+
+    def test_circuit_breaker_thread_safety(self, thread_pool):
+        """Test circuit breaker state stays consistent under contention."""
+        breaker = CircuitBreaker(failure_threshold=16, expected_exception=RuntimeError)
+        n_threads = POOL_SIZE
+        barrier = threading.Barrier(n_threads, timeout=10)
+
+        def fail():
+            raise RuntimeError("Test error")
+
+        def worker(index):
+            operation = fail if index % 2 else (lambda: "success")
+            barrier.wait()
             try:
-                result = breaker.call(lambda: "success")
-                results.append(result)
-            except Exception as e:
-                exceptions.append(e)
+                breaker.call(operation)
+            except CircuitBreakerOpenError:
+                return "rejected"
+            except RuntimeError:
+                return "failed"
+            return "success"
 
-        # Start multiple threads
-        threads = [threading.Thread(target=worker) for _ in range(5)]
-        for thread in threads:
-            thread.start()
+        outcomes = list(thread_pool.map(worker, range(n_threads)))
 
-        for thread in threads:
-            thread.join()
+        # Every call finished, and every failure that ran was counted exactly once
+        assert len(outcomes) == n_threads
+        assert breaker.get_state_info()["failure_count"] == outcomes.count("failed")
+        assert breaker.failure_threshold <= outcomes.count("failed") <= n_threads // 2
+        assert breaker.state == "open"
+
+    def test_circuit_breaker_last_failure_time_is_wall_clock(self):
+        """Test last_failure_time reports epoch time, not the injected clock."""
+        clock = FakeClock(now=5.0)
+        breaker = CircuitBreaker(failure_threshold=1, clock=clock)
+
+        with patch("ghostctl.utils.retry.time.time", return_value=1_700_000_000.0):
+            _drive_failures(breaker, 1)
 
-        # All should succeed
-        assert len(results) == 5
-        assert len(exceptions) == 0
-        assert all(r == "success" for r in results)
+        assert breaker.get_state_info()["last_failure_time"] == 1_700_000_000.0
+
+    def test_circuit_breaker_reset(self):
+        """Test reset closes an open circuit and clears failures."""
+        breaker = CircuitBreaker(failure_threshold=1)
+        with pytest.raises(Exception):
+            breaker.call(Mock(side_effect=Exception("Error")))
+        assert breaker.state == "open"
+
+        breaker.reset()
+
+        assert breaker.state == "closed"
+        assert breaker.get_state_info()["failure_count"] == 0
+        assert breaker.get_state_info()["last_failure_time"] is None
 
     def test_get_state_info(self):
         """Test getting circuit breaker state information."""
@@ -500,51 +597,39 @@ class TestCircuitBreaker:
 class TestRetryDecorator:
     """Test cases for the retry decorator."""
 
-    def test_retry_decorator_success(self):
-        """Test retry decorator with successful function."""
-        @retry(max_retries=2, base_delay=0.01)
-        def successful_function():
-            return "success"
-
-        result = successful_function()
-        assert result == "success"
+    @pytest.mark.parametrize(
+        "outcomes, args, kwargs, expected",
+        [
+            pytest.param(("success",), (), {}, "success", id="success"),
+            pytest.param(
+                (ConnectionError("Network error"), ConnectionError("Network error"), "success"),
+                (), {}, "success",
+                id="with_retries",
+            ),
+            pytest.param(
+                (ConnectionError("Always fails"),) * 3,
+                (), {}, MaxRetriesExceededError,
+                id="max_retries_exceeded",
+            ),
+            pytest.param(("x-y-z",), ("x", "y"), {"c": "z"}, "x-y-z", id="with_args_kwargs"),
+        ],
+    )
+    def test_retry_decorator(self, outcomes, args, kwargs, expected):
+        """Test retry decorator results, retries and argument passing."""
+        operation = _sequence(*outcomes)
 
-    def test_retry_decorator_with_retries(self):
-        """Test retry decorator with function that succeeds after retries."""
-        call_count = 0
-
-        @retry(max_retries=3, base_delay=0.01)
-        def flaky_function():
-            nonlocal call_count
-            call_count += 1
-            if call_count < 3:
-                raise ConnectionError("Network error")
-            return "success"
-
-        with patch("time.sleep"):
-            result = flaky_function()
-
-        assert result == "success"
-        assert call_count == 3
-
-    def test_retry_decorator_max_retries_exceeded(self):
-        """Test retry decorator when max retries are exceeded."""
         @retry(max_retries=2, base_delay=0.01)
-        def always_failing_function():
-            raise ConnectionError("Always fails")
+        def decorated(*args, **kwargs):
+            return operation(*args, **kwargs)
 
-        with patch("time.sleep"):
-            with pytest.raises(MaxRetriesExceededError):
-                always_failing_function()
+        if isinstance(expected, type) and issubclass(expected, Exception):
+            with pytest.raises(expected):
+                decorated(*args, **kwargs)
+        else:
+            assert decorated(*args, **kwargs) == expected
 
-    def test_retry_decorator_with_args_kwargs(self):
-        """Test retry decorator with function arguments."""
-        @retry(max_retries=1, base_delay=0.01)
-        def function_with_args(a, b, c=None):
-            return f"{a}-{b}-{c}"
-
-        result = function_with_args("x", "y", c="z")
-        assert result == "x-y-z"
+        # Every attempt is made with the caller's arguments
+        assert operation.calls == [(args, kwargs)] * len(outcomes)
 
 
 class TestCircuitBreakerDecorator:
@@ -593,11 +678,13 @@ class TestCircuitBreakerDecorator:
     def test_circuit_breaker_decorator_recovery(self):
         """Test circuit breaker decorator recovery."""
         call_count = 0
+        clock = FakeClock()
 
         @circuit_breaker(
             failure_threshold=1,
             recovery_timeout=0.1,
-            expected_exception=ValueError
+            expected_exception=ValueError,
+            clock=clock,
         )
         def function_that_recovers():
             nonlocal call_count
@@ -615,7 +702,38 @@ class TestCircuitBreakerDecorator:
             function_that_recovers()
 
         # Wait for recovery and try again
-        time.sleep(0.2)
+        clock.advance(0.2)
         result = function_that_recovers()
         assert result == "recovered"
-        assert call_count == 2
\ No newline at end of file
+        assert call_count == 2
+
+
+@requires_benchmark
+@pytest.mark.benchmark(group="retry-hotpath")
+class TestRetryHotPaths:
+    """Microbenchmarks for code that runs on every retried request.
+
+    Skipped by default through ``--benchmark-skip`` in addopts. Run them with
+    ``pytest -o addopts="" tests/unit/test_retry.py --benchmark-only`` and
+    compare runs with ``--benchmark-compare-fail=mean:10%`` to catch
+    per-call regressions.
+    """
+
+    def test_bench_should_retry(self, benchmark):
+        """Benchmark should_retry on a retryable exception."""
+        manager = RetryManager()
+        error = ConnectionError()
+
+        assert benchmark(manager.should_retry, error) is True
+
+    def test_bench_calculate_delay(self, benchmark):
+        """Benchmark calculate_delay with jitter."""
+        manager = RetryManager()
+
+        assert benchmark(manager.calculate_delay, 5) >= 32.0
+
+    def test_bench_circuit_breaker_call(self, benchmark):
+        """Benchmark a successful call through a closed circuit breaker."""
+        breaker = CircuitBreaker()
+
+        assert benchmark(breaker.call, lambda: 1) == 1
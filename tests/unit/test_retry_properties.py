@@ -0,0 +1,37 @@
+"""Property-based tests for retry delay calculation.
+
+Checks RetryManager.calculate_delay against its closed form over a wide
+range of settings instead of a handful of hand-picked attempts.
+"""
+
+import math
+
+import pytest
+
+pytest.importorskip("hypothesis")
+from hypothesis import given, strategies as st  # noqa: E402
+
+from ghostctl.utils.retry import RetryManager  # noqa: E402
+
+attempts = st.integers(min_value=0, max_value=30)
+base_delays = st.floats(min_value=0.001, max_value=100)
+backoff_factors = st.floats(min_value=1.01, max_value=10)
+max_delays = st.floats(min_value=0.1, max_value=1e6)
+
+
+@given(attempt=attempts, base=base_delays, factor=backoff_factors, cap=max_delays)
+def test_delay_without_jitter_matches_formula(attempt, base, factor, cap):
+    """Test the delay is base * factor**attempt, capped at max_delay."""
+    manager = RetryManager(base_delay=base, max_delay=cap, backoff_factor=factor, jitter=False)
+
+    expected = min(base * factor ** attempt, cap)
+    assert math.isclose(manager.calculate_delay(attempt), expected, rel_tol=1e-9)
+
+
+@given(attempt=attempts, base=base_delays, factor=backoff_factors, cap=max_delays)
+def test_delay_with_jitter_stays_in_range(attempt, base, factor, cap):
+    """Test jitter adds between 0% and 100% of the capped delay."""
+    manager = RetryManager(base_delay=base, max_delay=cap, backoff_factor=factor, jitter=True)
+
+    capped = min(base * factor ** attempt, cap)
+    assert capped <= manager.calculate_delay(attempt) <= 2 * capped